@@ -52,6 +52,9 @@ class OPENSEARCH_CONFIG:
     VERIFY_CERTS = "verify_certs"
     SSL_ASSERT_HOSTNAME = "ssl_assert_hostname"
     CA_CERTS = "ca_certs"
+    POOL_MAXSIZE = "pool_maxsize"
+    TIMEOUT = "timeout"
+    MAX_RETRIES = "max_retries"
 
 
 class KAFKA_SSL_CONFIG:
@@ -14,7 +14,10 @@
 #   limitations under the License.
 #
 
+import base64
+import json
 import os
+import time
 from furl import furl
 
 from hopsworks import client, constants
@@ -28,9 +31,24 @@ class OpenSearchApi:
     ):
         self._project_id = project_id
         self._project_name = project_name
+        self._opensearch_url = None
+        self._ca_chain_path = None
+        self._token = None
+        self._token_exp = 0
 
     def _get_opensearch_url(self):
-        return os.environ[constants.ENV_VARS.ELASTIC_ENDPOINT_ENV_VAR]
+        if self._opensearch_url is None:
+            self._opensearch_url = furl(
+                os.environ[constants.ENV_VARS.ELASTIC_ENDPOINT_ENV_VAR]
+            )
+        return self._opensearch_url
+
+    def _get_ca_chain_path(self):
+        if self._ca_chain_path is None:
+            self._ca_chain_path = client.get_instance()._get_ca_chain_path(
+                self._project_name
+            )
+        return self._ca_chain_path
 
     def get_project_index(self, index):
         """
@@ -44,7 +62,9 @@ class OpenSearchApi:
         """
         return (self._project_name + "_" + index).lower()
 
-    def get_default_py_config(self):
+    def get_default_py_config(
+        self, pool_maxsize: int = 32, timeout: int = 10, max_retries: int = 3
+    ):
         """
         Get the required opensearch configuration to setup a connection using the *opensearch-py* library.
 
@@ -62,10 +82,16 @@ class OpenSearchApi:
         client = OpenSearch(**opensearch_api.get_default_py_config())
 
         ```
+        Args:
+            :pool_maxsize: maximum number of pooled connections kept per host, should be at least
+                the number of threads issuing concurrent requests through the client.
+            :timeout: default timeout in seconds for requests.
+            :max_retries: maximum number of retries before a request is considered failed.
+
         Returns:
             A dictionary with required configuration.
         """
-        url = furl(self._get_opensearch_url())
+        url = self._get_opensearch_url()
         return {
             constants.OPENSEARCH_CONFIG.HOSTS: [{"host": url.host, "port": url.port}],
             constants.OPENSEARCH_CONFIG.HTTP_COMPRESS: False,
@@ -75,23 +101,41 @@ class OpenSearchApi:
             constants.OPENSEARCH_CONFIG.USE_SSL: True,
             constants.OPENSEARCH_CONFIG.VERIFY_CERTS: True,
             constants.OPENSEARCH_CONFIG.SSL_ASSERT_HOSTNAME: False,
-            constants.OPENSEARCH_CONFIG.CA_CERTS: client.get_instance()._get_ca_chain_path(
-                self._project_name
-            ),
+            constants.OPENSEARCH_CONFIG.CA_CERTS: self._get_ca_chain_path(),
+            constants.OPENSEARCH_CONFIG.POOL_MAXSIZE: pool_maxsize,
+            constants.OPENSEARCH_CONFIG.TIMEOUT: timeout,
+            constants.OPENSEARCH_CONFIG.MAX_RETRIES: max_retries,
         }
 
     def _get_authorization_token(self):
 
         """Get opensearch jwt token.
 
+        The token is cached and only requested again when it expires within the next minute.
+
         # Returns
             `str`: OpenSearch jwt token
         # Raises
             `RestAPIError`: If unable to get the token
         """
+        if self._token is not None and time.time() < self._token_exp - 60:
+            return self._token
 
         _client = client.get_instance()
         path_params = ["elastic", "jwt", self._project_id]
 
         headers = {"content-type": "application/json"}
-        return _client._send_request("GET", path_params, headers=headers)["token"]
+        self._token = _client._send_request("GET", path_params, headers=headers)[
+            "token"
+        ]
+        self._token_exp = self._get_token_expiration(self._token)
+        return self._token
+
+    def _get_token_expiration(self, token):
+        """Read the `exp` claim of a jwt, returns 0 if it cannot be parsed."""
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        except (IndexError, KeyError, TypeError, ValueError):
+            return 0